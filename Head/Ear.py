@@ -1,15 +1,11 @@
 import speech_recognition as sr
 import os
-import threading
 from mtranslate import translate
 from colorama import Fore, Style, init
+from Head.vad import is_silent
 
 init(autoreset=True)  # automatically reset style after each print
 
-def print_loop():
-    while True:
-        print(Fore.LIGHTGREEN_EX + "I am Listening...", end="\r", flush=True)
-
 def Trans_hindi_to_english(txt):
     english_txt = translate(txt, to_language="en-in")
     return english_txt
@@ -27,6 +23,9 @@ def listen():
             print(Fore.LIGHTGREEN_EX + "I am Listening...", end="\r", flush=True)
             try:
                 audio = recognizer.listen(source)
+                # skip clicks/noise bursts that never reach the ambient-calibrated level
+                if is_silent(audio, recognizer.energy_threshold):
+                    continue
                 print(Fore.YELLOW + "Got it, recognizing...", end="\r", flush=True)
                 recognized_txt = recognizer.recognize_google(audio, language="hi-IN").lower()
 
@@ -1,11 +1,29 @@
 import asyncio
-import threading
 import os
+import shutil
+import threading
 import edge_tts
 import pygame
 
 VOICE = "en-AU-WilliamNeural"
 BUFFER_SIZE = 1024
+SAMPLE_RATE = 24000  # edge-tts output rate
+FFMPEG = shutil.which("ffmpeg")  # needed to decode the mp3 stream as it arrives
+
+def init_mixer():
+    # Opening the SDL audio device is slow; do it once and keep it open
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(frequency=SAMPLE_RATE, buffer=BUFFER_SIZE)
+
+try:
+    init_mixer()
+except Exception as e:
+    print(f"Audio init error : {e}")
+
+# One event loop for the whole process; speak() submits to it instead of
+# building and tearing down a loop per utterance with asyncio.run
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, daemon=True).start()
 
 def remove_file(file_path):
     try:
@@ -16,26 +34,81 @@ def remove_file(file_path):
 
 def play_audio(file_path):
     try:
-        pygame.init()
-        pygame.mixer.init()
+        init_mixer()
         pygame.mixer.music.load(file_path)
         pygame.mixer.music.play()
 
+        clock = pygame.time.Clock()
         while pygame.mixer.music.get_busy():
-            pygame.time.wait(100)
+            clock.tick(50)
 
-        pygame.mixer.quit()
+        # release the file so it can be removed; the mixer itself stays open
+        pygame.mixer.music.unload()
     except Exception as e:
         print(f"Audio error : {e}")
 
+async def stream_audio(tts):
+    # Pipe mp3 chunks through ffmpeg as edge-tts yields them and queue the
+    # decoded PCM on a mixer channel, so playback starts after the first chunk
+    freq, _, channels = pygame.mixer.get_init()
+    frame = 2 * channels  # bytes per s16 sample frame
+    block = freq * frame // 5  # ~200 ms of audio per Sound
+    proc = await asyncio.create_subprocess_exec(
+        FFMPEG, "-loglevel", "quiet", "-f", "mp3", "-i", "pipe:0",
+        "-f", "s16le", "-ac", str(channels), "-ar", str(freq), "pipe:1",
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE)
+
+    async def feed():
+        try:
+            async for chunk in tts.stream():
+                if chunk["type"] == "audio":
+                    proc.stdin.write(chunk["data"])
+                    await proc.stdin.drain()
+        finally:
+            proc.stdin.close()
+
+    feeder = asyncio.create_task(feed())
+    channel = pygame.mixer.find_channel(True)
+    pending = b""
+    try:
+        while True:
+            # read() returns whatever ffmpeg has flushed, so keep reading
+            # until a full block (or EOF) is buffered before making a Sound
+            data = await proc.stdout.read(block)
+            eof = not data
+            pending += data
+            if len(pending) < block and not eof:
+                continue
+            usable = len(pending) - len(pending) % frame
+            if usable:
+                sound = pygame.mixer.Sound(buffer=pending[:usable])
+                pending = pending[usable:]
+                while channel.get_queue() is not None:
+                    await asyncio.sleep(0.01)
+                if channel.get_busy():
+                    channel.queue(sound)
+                else:
+                    channel.play(sound)
+            if eof:
+                break
+        await feeder
+    finally:
+        feeder.cancel()
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+    while channel.get_busy():
+        await asyncio.sleep(0.02)
+
 async def amain(TEXT, output_file) -> None:
     try:
         tts = edge_tts.Communicate(TEXT, VOICE)
+        if FFMPEG and pygame.mixer.get_init():
+            await stream_audio(tts)
+            return
         await tts.save(output_file)
 
-        thread = threading.Thread(target=play_audio, args=(output_file,))
-        thread.start()
-        thread.join()
+        await asyncio.to_thread(play_audio, output_file)
     except Exception as e:
         print(f"TTS error : {e}")
     finally:
@@ -44,7 +117,7 @@ async def amain(TEXT, output_file) -> None:
 def speak(TEXT, output_file=None):
     if output_file is None:
         output_file = os.path.join(os.getcwd(), "speech.mp3")
-    asyncio.run(amain(TEXT, output_file))
+    asyncio.run_coroutine_threadsafe(amain(TEXT, output_file), _loop).result()
 
 # Test
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+import numpy as np
+
+RATE = 16000
+FRAME = RATE // 50       # 20 ms frames
+SILENT_RATIO = 0.9
+
+def is_silent(audio, energy_threshold):
+    """True if nearly every 20 ms frame of `audio` is quieter than `energy_threshold`.
+
+    Frame loudness is RMS over 16-bit samples, the same measure speech_recognition
+    uses for Recognizer.energy_threshold, so a calibrated threshold can be passed in.
+    """
+    x = np.frombuffer(audio.get_raw_data(convert_rate=RATE, convert_width=2), dtype=np.int16)
+    n = x.size // FRAME
+    if n == 0:
+        return True
+    frames = x[:n * FRAME].reshape(n, FRAME).astype(np.float32)
+    rms = np.sqrt((frames ** 2).mean(axis=1))
+    return (rms < energy_threshold).mean() > SILENT_RATIO
@@ -1,14 +1,6 @@
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from Head.Mouth import speak   # make sure speak() is correct
-
-# Make sure nltk assets are downloaded once
-nltk.download('punkt')
-nltk.download('stopwords')
+from Head.stopwords import ENGLISH_STOP_WORDS
 
 def load_dataset(file_path):
     with open(file_path, 'r', encoding='utf-8') as file:
@@ -17,30 +9,40 @@ def load_dataset(file_path):
         dataset = [{'question': q, 'answer': a} for q, a in qna_pairs]
         return dataset
 
-def preprocess_text(text):
-    stop_words = set(stopwords.words('english'))
-    ps = PorterStemmer()
-    tokens = word_tokenize(text.lower())
-    tokens = [ps.stem(token) for token in tokens if token.isalnum() and token not in stop_words]
-    return " ".join(tokens)
-
 def train_tfidf_vectorizer(dataset):
-    corpus = [preprocess_text(qa['question']) for qa in dataset]
-    vectorizer = TfidfVectorizer()
+    corpus = [qa['question'] for qa in dataset]
+    # NLTK's English stopwords, inlined: no NLTK on the train or query path
+    vectorizer = TfidfVectorizer(analyzer="word", stop_words=sorted(ENGLISH_STOP_WORDS))
     X = vectorizer.fit_transform(corpus)
     return vectorizer, X
 
 def get_answer(question, vectorizer, X, dataset):
-    processed_q = preprocess_text(question)
-    question_vec = vectorizer.transform([processed_q])
-    similarities = cosine_similarity(question_vec, X)
-    best_match_index = similarities.argmax()
+    question_vec = vectorizer.transform([question])
+    # Rows are L2-normalized by TfidfVectorizer, so q . X^T is the cosine similarity.
+    # The 1 x N result stays sparse; only rows sharing a term with q are scanned.
+    similarities = (question_vec @ X.T).tocsr()
+    if similarities.nnz:
+        similarities.sort_indices()
+        best_match_index = similarities.indices[similarities.data.argmax()]
+    else:
+        best_match_index = 0
     return dataset[best_match_index]['answer']
 
+DATASET_PATH = r'/home/ak/Desktop/JARVIS/Data/brain_data/qna_dat.txt'
+
+# (vectorizer, X, dataset) -- trained lazily on first use, then reused
+_MODEL = None
+
+def _get_model():
+    global _MODEL
+    if _MODEL is None:
+        dataset = load_dataset(DATASET_PATH)
+        vectorizer, X = train_tfidf_vectorizer(dataset)
+        _MODEL = (vectorizer, X, dataset)
+    return _MODEL
+
 def mind(text):
-    dataset_path = r'/home/ak/Desktop/JARVIS/Data/brain_data/qna_dat.txt'
-    dataset = load_dataset(dataset_path)
-    vectorizer, X = train_tfidf_vectorizer(dataset)
+    vectorizer, X, dataset = _get_model()
     answer = get_answer(text, vectorizer, X, dataset)
     speak(answer)
 
@@ -4,11 +4,14 @@ import time
 import threading
 import webbrowser
 import logging
+import collections
 import queue
 import socket
 import datetime
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import hashlib
+import glob
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
 # Optional / external libraries
@@ -25,21 +28,19 @@ except Exception as e:
     raise
 
 try:
-    import nltk
-    from nltk.tokenize import word_tokenize
-    from nltk.corpus import stopwords
-    from nltk.stem import PorterStemmer
-except Exception:
-    print("Missing NLTK. Install with: pip install nltk")
-    raise
-
-try:
+    import sklearn
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
+    import joblib
 except Exception:
     print("Missing scikit-learn. Install with: pip install scikit-learn")
     raise
 
+from Head.vad import is_silent
+from Head.stopwords import ENGLISH_STOP_WORDS
+
+# TfidfVectorizer only accepts a list here
+_STOP_WORDS = sorted(ENGLISH_STOP_WORDS)
+
 # Optional: keyboard listener (may require root on Linux)
 try:
     import keyboard
@@ -51,19 +52,30 @@ except Exception:
 logging.basicConfig(level=logging.INFO, filename="isha_assistant.log",
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
-# Download necessary NLTK data (safe to call repeatedly)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+def _best_match(qv, XT):
+    """Return (row index, score) of the best-scoring document for query vector qv.
+
+    XT is the transposed TF-IDF matrix (vocab x N) in CSR form, so the product
+    is a single CSR x CSR multiply with no per-query format conversion.
+    """
+    # 1 x N sparse result: only rows sharing a term with the query are stored
+    scores = qv @ XT
+    if scores.nnz == 0:
+        return None, 0.0
+    scores.sort_indices()  # ties resolve to the earliest row, as with dense argmax
+    i = scores.data.argmax()
+    return int(scores.indices[i]), float(scores.data[i])
+
 
 # Default dataset path (you can change it at runtime)
 DEFAULT_QNA_PATH = os.path.join(os.path.expanduser("~"), "Desktop", "JARVIS", "Data", "brain_data", "qna_dat.txt")
 
+# Fitted TF-IDF artifacts are cached here, one entry per dataset path, keyed by
+# the dataset contents, QNA_CACHE_VERSION and the scikit-learn version.
+# Bump QNA_CACHE_VERSION whenever preprocessing/vectorizer settings change.
+QNA_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jarvis")
+QNA_CACHE_VERSION = 5
+
 class QnAModel:
     """Loads QnA dataset once and prepares TF-IDF model for simple matching."""
     def __init__(self, path=None):
@@ -71,7 +83,7 @@ class QnAModel:
         self.dataset = []
         self.vectorizer = None
         self.X = None
-        self.lock = threading.Lock()
+        self._XT = None
         self._load_and_train()
 
     def _load_and_train(self):
@@ -79,8 +91,16 @@ class QnAModel:
             if not os.path.isfile(self.path):
                 logging.warning("QnA dataset not found at %s. Continuing without QnA.", self.path)
                 return
-            with open(self.path, 'r', encoding='utf-8') as f:
-                lines = [ln.strip() for ln in f if ln.strip()]
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            path_id = hashlib.sha1(os.path.abspath(self.path).encode('utf-8')).hexdigest()[:12]
+            key = hashlib.sha1(raw + f"|{QNA_CACHE_VERSION}|{sklearn.__version__}".encode()).hexdigest()
+            cache_prefix = f"qna_{path_id}_"
+            cache_path = os.path.join(QNA_CACHE_DIR, f"{cache_prefix}{key}.joblib")
+            if self._load_cache(cache_path):
+                logging.info("QnA model loaded from cache (%d pairs).", len(self.dataset))
+                return
+            lines = [ln.strip() for ln in raw.decode('utf-8').splitlines() if ln.strip()]
             pairs = []
             for line in lines:
                 if ':' in line:
@@ -90,45 +110,79 @@ class QnAModel:
                 logging.warning("QnA file found but no valid 'question:answer' lines detected.")
                 return
             self.dataset = pairs
-            corpus = [self._preprocess_text(qa['question']) for qa in self.dataset]
-            self.vectorizer = TfidfVectorizer()
+            corpus = [qa['question'] for qa in self.dataset]
+            # Word tokens minus NLTK's English stopwords (as the original pipeline
+            # used), so the 0.15 cutoff in get_answer keeps its meaning
+            self.vectorizer = TfidfVectorizer(analyzer="word", stop_words=_STOP_WORDS)
             self.X = self.vectorizer.fit_transform(corpus)
+            self._XT = self.X.T.tocsr()
             logging.info("QnA model trained on %d pairs.", len(self.dataset))
+            self._save_cache(cache_path, cache_prefix)
         except Exception as e:
             logging.exception("Failed to load/train QnA model: %s", e)
 
-    def _preprocess_text(self, text):
-        stop_words = set(stopwords.words('english'))
-        ps = PorterStemmer()
-        tokens = word_tokenize(text.lower())
-        tokens = [ps.stem(t) for t in tokens if t.isalnum() and t not in stop_words]
-        return " ".join(tokens)
+    def _load_cache(self, cache_path):
+        if not os.path.isfile(cache_path):
+            return False
+        try:
+            self.vectorizer, self.X, self.dataset = joblib.load(cache_path)
+            self._XT = self.X.T.tocsr()
+            return True
+        except Exception as e:
+            logging.warning("Ignoring unreadable QnA cache %s: %s", cache_path, e)
+            return False
+
+    def _save_cache(self, cache_path, cache_prefix):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            joblib.dump((self.vectorizer, self.X, self.dataset), cache_path)
+        except Exception as e:
+            logging.warning("Could not write QnA cache %s: %s", cache_path, e)
+            return
+        # Older entries for this dataset path are never reused; other paths' caches are kept
+        for old in glob.glob(os.path.join(os.path.dirname(cache_path), f"{cache_prefix}*.joblib")):
+            if os.path.abspath(old) == os.path.abspath(cache_path):
+                continue
+            try:
+                os.remove(old)
+            except OSError as e:
+                logging.warning("Could not remove stale QnA cache %s: %s", old, e)
 
     def get_answer(self, question):
-        with self.lock:
-            if not self.dataset or self.vectorizer is None or self.X is None:
-                return None
-            proc = self._preprocess_text(question)
-            qv = self.vectorizer.transform([proc])
-            sims = cosine_similarity(qv, self.X)
-            best = sims.argmax()
-            score = sims[0, best]
-            if score < 0.15:
-                return None
-            return self.dataset[best]['answer']
+        # Read-only after training, so concurrent requests need no lock
+        if not self.dataset or self.vectorizer is None or self.X is None:
+            return None
+        qv = self.vectorizer.transform([question])
+        # TfidfVectorizer rows are L2-normalized, so a dot product is cosine similarity
+        best, score = _best_match(qv, self._XT)
+        if best is None or score < 0.15:
+            return None
+        return self.dataset[best]['answer']
 
 class IshaAssistant:
     def __init__(self, host='localhost', port=8000):
         self.engine = pyttsx3.init()
         self.engine.setProperty('rate', 150)
         self.engine.setProperty('volume', 0.9)
+        # Single long-lived TTS thread; speak() only enqueues text
+        self._tts_q = queue.SimpleQueue()
+        # Set whenever every queued utterance has been spoken
+        self._tts_done = threading.Event()
+        self._tts_done.set()
+        self._tts_pending = 0
+        self._tts_lock = threading.Lock()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
         self.recognizer = sr.Recognizer()
         self.microphone = None
         self.is_listening = False
-        self.last_internet_check = 0
         self.internet_status = False
+        self._internet_probe = None
+        self._internet_probe_lock = threading.Lock()
         self.internet_check_interval = 10
-        self.input_queue = queue.Queue()
+        self.last_calibration = time.time()
+        self.calibration_interval = 60
+        # Bounded; deque append/popleft are atomic, so no lock is needed
+        self.input_queue = collections.deque(maxlen=16)
         self.pending = None
         self.qna = QnAModel()
         self.host = host
@@ -189,38 +243,52 @@ class IshaAssistant:
             logging.exception("Failed to set voice: %s", e)
 
     def speak(self, text):
-        """Non-blocking TTS (spawns a daemon thread)."""
-        def _run(t):
+        """Non-blocking TTS (queues text for the TTS worker thread)."""
+        with self._tts_lock:
+            self._tts_pending += 1
+            self._tts_done.clear()
+        self._tts_q.put(text)
+
+    def _tts_worker(self):
+        while True:
+            t = self._tts_q.get()
             try:
-                # small stop/reinit guard
-                try:
-                    self.engine.stop()
-                except Exception:
-                    pass
                 self.engine.say(t)
                 self.engine.runAndWait()
                 logging.info("Spoke: %s", t)
             except Exception as e:
                 logging.exception("TTS failed: %s", e)
-        threading.Thread(target=_run, args=(text,), daemon=True).start()
-        time.sleep(0.25)
+            with self._tts_lock:
+                self._tts_pending -= 1
+                if self._tts_pending == 0:
+                    self._tts_done.set()
 
     # -------------------- Utilities --------------------
     def check_internet(self):
-        now = time.time()
-        if now - self.last_internet_check < self.internet_check_interval:
-            return self.internet_status
-        self.last_internet_check = now
+        """Last result of the background probe; never blocks."""
+        # Probe thread starts on first use so nothing touches the network unless asked.
+        # Until its first probe completes this reports the initial False.
+        if self._internet_probe is None:
+            with self._internet_probe_lock:
+                if self._internet_probe is None:
+                    self._internet_probe = threading.Thread(target=self._internet_probe_loop, daemon=True)
+                    self._internet_probe.start()
+        return self.internet_status
+
+    def _probe_internet(self):
         for host, port in [("8.8.8.8", 53), ("1.1.1.1", 53)]:
             try:
-                socket.create_connection((host, port), timeout=2)
-                self.internet_status = True
-                return True
+                with socket.create_connection((host, port), timeout=2):
+                    return True
             except Exception:
                 continue
-        self.internet_status = False
         return False
 
+    def _internet_probe_loop(self):
+        while True:
+            self.internet_status = self._probe_internet()
+            time.sleep(self.internet_check_interval)
+
     def wish_me(self):
         hour = datetime.datetime.now().hour
         if 5 <= hour < 12:
@@ -232,7 +300,6 @@ class IshaAssistant:
         else:
             g = "Hello"
         self.speak(g + ". I am Isha — your assistant.")
-        time.sleep(0.8)
 
     # -------------------- Microphone / Voice --------------------
     def select_microphone(self):
@@ -254,6 +321,7 @@ class IshaAssistant:
                 self.microphone = sr.Microphone(device_index=idx)
                 with self.microphone as source:
                     self.recognizer.adjust_for_ambient_noise(source, duration=1.5)
+                self.last_calibration = time.time()
                 self.speak(f"Selected microphone: {names[idx]}")
                 return self.microphone
         except Exception as e:
@@ -276,6 +344,8 @@ class IshaAssistant:
 
     def _listen_loop(self):
         while self.is_listening:
+            # don't let the microphone pick up our own speech
+            self._tts_done.wait(timeout=15)
             cmd = self.listen_once()
             if cmd:
                 self.process_command(cmd)
@@ -286,8 +356,15 @@ class IshaAssistant:
             return None
         try:
             with self.microphone as src:
-                self.recognizer.adjust_for_ambient_noise(src, duration=0.7)
+                # ambient noise barely changes between utterances; recalibrate occasionally
+                if time.time() - self.last_calibration > self.calibration_interval:
+                    self.recognizer.adjust_for_ambient_noise(src, duration=0.5)
+                    self.last_calibration = time.time()
                 audio = self.recognizer.listen(src, timeout=8, phrase_time_limit=8)
+            # nearly every frame under the calibrated threshold: not worth a Google round trip
+            if is_silent(audio, self.recognizer.energy_threshold):
+                logging.info("Skipping silent/noise-only audio")
+                return None
             try:
                 q = self.recognizer.recognize_google(audio).lower()
                 logging.info("Heard: %s", q)
@@ -375,19 +452,19 @@ class IshaAssistant:
 
     # -------------------- Dashboard (static minimal) --------------------
     def _create_dashboard_file(self):
-        html = f"""<!doctype html>
+        html = """<!doctype html>
 <html>
 <head>
 <meta charset="utf-8"/>
 <title>Isha Assistant</title>
 <style>
-body{{font-family: Arial, Helvetica, sans-serif; background:#071027;color:#eaf6ff; padding:20px}}
-.container{{max-width:900px;margin:0 auto;background: rgba(255,255,255,0.02); padding:18px;border-radius:12px}}
-input[type=text]{{width:80%;padding:10px;border-radius:8px;border:1px solid rgba(255,255,255,0.06)}}
-button{{padding:10px 12px;border-radius:8px;border:none;cursor:pointer;background:#07a; color:white}}
-.app-list{{margin-top:12px}}
-.item{{padding:6px 0;cursor:pointer}}
-.small{{font-size:13px;color:#cbefff;opacity:0.9}}
+body{font-family: Arial, Helvetica, sans-serif; background:#071027;color:#eaf6ff; padding:20px}
+.container{max-width:900px;margin:0 auto;background: rgba(255,255,255,0.02); padding:18px;border-radius:12px}
+input[type=text]{width:80%;padding:10px;border-radius:8px;border:1px solid rgba(255,255,255,0.06)}
+button{padding:10px 12px;border-radius:8px;border:none;cursor:pointer;background:#07a; color:white}
+.app-list{margin-top:12px}
+.item{padding:6px 0;cursor:pointer}
+.small{font-size:13px;color:#cbefff;opacity:0.9}
 </style>
 </head>
 <body>
@@ -425,11 +502,18 @@ document.addEventListener('keydown', (e)=>{ if(e.altKey && e.key.toLowerCase()==
 </body>
 </html>
 """
+        # Served from memory; the file on disk is only refreshed when it differs
+        self._dashboard_bytes = html.encode('utf-8')
         try:
             fn = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.html")
-            with open(fn, 'w', encoding='utf-8') as f:
-                f.write(html)
-            logging.info("Dashboard written to %s", fn)
+            current = None
+            if os.path.exists(fn):
+                with open(fn, 'rb') as f:
+                    current = f.read()
+            if current != self._dashboard_bytes:
+                with open(fn, 'wb') as f:
+                    f.write(self._dashboard_bytes)
+                logging.info("Dashboard written to %s", fn)
         except Exception as e:
             logging.exception("Failed to write dashboard.html: %s", e)
 
@@ -438,10 +522,9 @@ document.addEventListener('keydown', (e)=>{ if(e.altKey && e.key.toLowerCase()==
             def do_GET(inner_self):
                 parsed = urlparse(inner_self.path)
                 if parsed.path == '/':
-                    # serve static file
+                    # serve the dashboard from memory
                     try:
-                        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.html"), 'rb') as fh:
-                            content = fh.read()
+                        content = inner_self.server.dashboard_bytes
                         inner_self.send_response(200)
                         inner_self.send_header('Content-type', 'text/html; charset=utf-8')
                         inner_self.end_headers()
@@ -460,7 +543,7 @@ document.addEventListener('keydown', (e)=>{ if(e.altKey && e.key.toLowerCase()==
                         return
                     # When assistant is pending input, queue it; else process immediately
                     if self.pending:
-                        self.input_queue.put(cmd)
+                        self.input_queue.append(cmd)
                         inner_self.send_response(200)
                         inner_self.end_headers()
                         inner_self.wfile.write(b"Queued input")
@@ -490,7 +573,8 @@ document.addEventListener('keydown', (e)=>{ if(e.altKey && e.key.toLowerCase()==
 
         def serve():
             try:
-                server = HTTPServer((self.host, self.port), Handler)
+                server = ThreadingHTTPServer((self.host, self.port), Handler)
+                server.dashboard_bytes = self._dashboard_bytes
                 logging.info("Starting server on %s:%s", self.host, self.port)
                 # open in browser
                 url = f"http://{self.host}:{self.port}/"